@@ -52,6 +52,31 @@ def rgetattr(obj, attr, *args):
     return functools.reduce(_getattr, [obj] + attr.split("."))
 
 
+def _overlapping_relatives(adjacency, node, exon) -> set:
+    """Find the nodes reachable from the given node which overlap an exon.
+    The adjacency should be either the "pred" (for ancestors) or the "succ" (for descendants) view of the graph.
+    As the paths in the exon/intron graph follow the genomic coordinates, a node lying outside of the exon cannot
+    lead back to one overlapping it; so the search stops there instead of visiting the whole graph, as
+    networkx.ancestors / networkx.descendants would do."""
+
+    found = set()
+    visited = {node}
+    stack = [node]
+    while stack:
+        for relative in adjacency[stack.pop()]:
+            if relative in visited:
+                continue
+            visited.add(relative)
+            olap = overlap(relative, exon)
+            if olap < 0:
+                continue
+            elif olap > 0:
+                found.add(relative)
+            stack.append(relative)
+
+    return found
+
+
 class Abstractlocus(metaclass=abc.ABCMeta):
     """This abstract class defines the basic features of any Locus-like object.
     It also defines methods/properties that are needed throughout the program,
@@ -643,9 +668,8 @@ class Abstractlocus(metaclass=abc.ABCMeta):
             if is_retained:
                 break
             # Only consider exons for which there is an overlap.
-            before = {_ for _ in networkx.ancestors(digraph, intron) if overlap(_, exon) > 0}
-
-            after = {_ for _ in networkx.descendants(digraph, intron) if overlap(_, exon) > 0}
+            before = _overlapping_relatives(digraph.pred, intron, exon)
+            after = _overlapping_relatives(digraph.succ, intron, exon)
 
             # Now we have to check whether the matched introns contain both coding and non-coding parts
             # Let us exclude any intron which is outside of the exonic span of interest.
@@ -728,6 +752,10 @@ class Abstractlocus(metaclass=abc.ABCMeta):
 
         retained_introns = []
         consider_truncated = self.json_conf["pick"]["run_options"]["consider_truncated_for_retained"]
+        # The segment tree and the graph are shared by all the transcripts of the locus;
+        # retrieve them once rather than for every exon.
+        segmenttree = self.segmenttree
+        internal_graph = self._internal_graph
 
         for exon in transcript.exons:
 
@@ -740,12 +768,12 @@ class Abstractlocus(metaclass=abc.ABCMeta):
                 continue
 
             self.logger.debug("Number of exons, introns, intervals in segmenttree: %d, %d, %d",
-                              len(self.exons), len(self.introns), len(self.segmenttree))
+                              len(self.exons), len(self.introns), len(segmenttree))
 
             is_retained = self._is_exon_retained(
                 exon,
-                self.segmenttree,
-                self._internal_graph,
+                segmenttree,
+                internal_graph,
                 frags,
                 consider_truncated=consider_truncated,
                 terminal=terminal,
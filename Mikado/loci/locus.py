@@ -6,20 +6,81 @@ i.e. the locus.
 """
 
 import collections
-import itertools
+import functools
+import heapq
+import logging
 import operator
-from collections import deque, defaultdict
+import os
+from collections import deque
+import numpy
 import pysam
 from ..transcripts.transcript import Transcript
 from ..transcripts.transcriptchecker import TranscriptChecker
 from .abstractlocus import Abstractlocus, rgetattr
-from ..parsers.GFF import GffLine
 from ..scales.assigner import Assigner
 from ..exceptions import InvalidTranscript
 import networkx as nx
 from itertools import combinations
 
 
+_GFF_TEMPLATE = "{chrom}\t{source}\t{feature}\t{start}\t{end}\t{score}\t{strand}\t.\t{attributes}"
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_expr(expression: str):
+    """Compile an evaluation expression from the configuration, memoising the result
+    so that each expression is parsed only once per run."""
+
+    return compile(expression, "<json>", "eval")
+
+
+@functools.lru_cache(maxsize=4)
+def _open_genome(path: str, pid: int) -> pysam.FastaFile:
+    """Open the indexed genome used for padding only once per process, rather than once per locus.
+    The PID is part of the key so that handles are never shared with forked children."""
+
+    return pysam.FastaFile(path)
+
+
+class _LazyEvaluated(dict):
+    """Dictionary of evaluated requirement parameters, which computes each value only when it is first accessed.
+    As "and"/"or" short-circuit inside the compiled expression, parameters which cannot change the outcome
+    are never evaluated."""
+
+    def __init__(self, evaluate):
+        super().__init__()
+        self.__evaluate = evaluate
+
+    def __missing__(self, key):
+        value = self[key] = self.__evaluate(key)
+        return value
+
+
+class _LocusSequence:
+    """Wrapper around a pysam.FastaFile which retrieves the genomic sequence of a whole locus with a single
+    fetch, on first use, and serves the requests falling inside the locus by slicing it in memory.
+    Anything else is delegated to the underlying FastaFile."""
+
+    def __init__(self, fai: pysam.FastaFile, chrom: str, start: int, end: int):
+        self.fai = fai
+        self.chrom, self.start, self.end = chrom, start, end
+        self.__seq = None
+
+    def fetch(self, reference, start=None, end=None):
+        if reference != self.chrom or start is None or end is None or start < self.start - 1 or end > self.end:
+            return self.fai.fetch(reference, start, end)
+        if self.__seq is None:
+            self.__seq = self.fai.fetch(self.chrom, self.start - 1, self.end)
+        offset = self.start - 1
+        return self.__seq[start - offset:end - offset]
+
+    def get_reference_length(self, reference):
+        return self.fai.get_reference_length(reference)
+
+    def __getitem__(self, reference):
+        return self.fai[reference]
+
+
 class Locus(Abstractlocus):
     """Class that defines the final loci.
     It is a child of monosublocus, but it also has the possibility of adding
@@ -58,13 +119,15 @@ class Locus(Abstractlocus):
         self.parent = None
         self.tid = transcript.id
         self.attributes = dict()
-        self.logger.debug("Created Locus object with {0}".format(transcript.id))
+        self.logger.debug("Created Locus object with %s", transcript.id)
         self.primary_transcript_id = transcript.id
         self.attributes["is_fragment"] = False
         self.metric_lines_store = []
         self.__id = None
         self.fai = None
         self.__finalized = False
+        self.__primary_cache = None
+        self.__segment_cache = None
         # if verified_introns is not None:
         #     self.locus_verified_introns = verified_introns
 
@@ -83,23 +146,44 @@ class Locus(Abstractlocus):
 
         lines = []
 
-        self_line = GffLine('')
-        for attr in ["chrom", 'feature', 'source', 'start', 'end', 'strand']:
-            setattr(self_line, attr, getattr(self, attr))
-        self_line.phase, self_line.score = None, self.score
-        self_line.id = self.id
-        self_line.name = self.name
-        self_line.attributes["superlocus"] = self.parent
-        self_line.attributes.update(self.attributes)
+        # Format the locus line directly, following the same rules as GffLine.
+        # This avoids building a GffLine object and setting its attributes one by one.
+        attributes = {"ID": self.id, "Parent": [], "Name": self.name, "superlocus": self.parent}
+        attributes.update(self.attributes)
         if "is_fragment" in self.attributes and self.attributes["is_fragment"] is False:
-            del self_line.attributes["is_fragment"]
-        self_line.attributes["multiexonic"] = (not self.monoexonic)
-        lines.append(str(self_line))
+            del attributes["is_fragment"]
+        attributes["multiexonic"] = (not self.monoexonic)
+        locus_id = attributes["ID"]
+
+        formatted = []
+        if locus_id is not None:
+            formatted.append("ID={0}".format(locus_id))
+        if attributes["Parent"] is not None and len(attributes["Parent"]) > 0:
+            formatted.append("Parent={0}".format(",".join(attributes["Parent"])))
+        if attributes["Name"] is not None:
+            attributes.pop("name", None)
+            formatted.append("Name={0}".format(attributes["Name"]))
+        elif attributes.get("name", None) is not None:
+            formatted.append("Name={0}".format(attributes.pop("name")))
+        formatted.extend("{0}={1}".format(key.lower(), attributes[key]) for key in sorted(attributes)
+                         if key not in ("ID", "Parent", "Name", "gene_id", "transcript_id") and
+                         attributes[key] is not None)
+
+        score = self.score
+        lines.append(_GFF_TEMPLATE.format(
+            chrom=self.chrom,
+            source=self.source if self.source is not None else "Mikado",
+            feature=self.feature,
+            start=self.start,
+            end=self.end,
+            score="." if score is None else int(round(score, 0)),
+            strand=self.strand if self.strand in ("+", "-") else ".",
+            attributes=";".join(formatted)))
 
         for tid in self.transcripts:
             transcript_instance = self.transcripts[tid]
             transcript_instance.source = self.source
-            transcript_instance.parent = self_line.id
+            transcript_instance.parent = locus_id
             self.logger.debug(self.attributes)
             for attribute in self.attributes:
                 if attribute not in transcript_instance.attributes:
@@ -128,33 +212,45 @@ class Locus(Abstractlocus):
         self.metrics_calculated = False
         self.scores_calculated = False
         self.calculate_scores()
-        max_isoforms = self.json_conf["pick"]["alternative_splicing"]["max_isoforms"]
+        as_conf = self.json_conf["pick"]["alternative_splicing"]
+        max_isoforms = as_conf["max_isoforms"]
 
+        primary_id = self.primary_transcript_id
+        # Avoid formatting messages and calling the logger for each transcript, when not debugging.
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         while True:
+            primary_score = self.transcripts[primary_id].score
+            threshold = as_conf["min_score_perc"] * primary_score
+
+            # Collect the transcripts over the threshold in a single pass. The negated position ensures that,
+            # as in a stable sort, ties are broken in favour of the transcripts which come first.
+            passing = []
+            for position, (tid, transcript) in enumerate(self.transcripts.items()):
+                if tid == primary_id:
+                    continue
+                score = transcript.score
+                if debug:
+                    self.logger.debug("Transcript, score, threshold: %s, %s, %s", tid, score, threshold)
+                if score >= threshold:
+                    passing.append((score, -position, tid))
+
+            self.logger.debug("%d transcripts have a score over the threshold", len(passing))
+            # Most often all the candidates fit within the limit and no selection is necessary.
+            # Otherwise, heapq selects the best ones with plain tuple comparisons, without a key function.
+            if len(passing) > max_isoforms:
+                passing = heapq.nlargest(max_isoforms, passing)
             # *Never* lose the primary transcript
-            to_keep = {self.primary_transcript_id}
-            order = sorted([(tid, self.transcripts[tid].score) for tid in self.transcripts
-                            if tid != self.primary_transcript_id],
-                           key=operator.itemgetter(1), reverse=True)
-            threshold = self.json_conf["pick"]["alternative_splicing"]["min_score_perc"] * self.primary_transcript.score
-
-            for obj in order:
-                self.logger.debug("Transcript, score, threshold: %s, %s, %s",
-                                  obj[0], obj[1], threshold)
-
-            # Islice will function also when the list is smaller than "max_isoforms"
-            score_passing = [_ for _ in order if _[1] >= threshold]
-            self.logger.debug("%d transcripts have a score over the threshold", len(score_passing))
-
-            to_keep.update(set([_[0] for _ in itertools.islice(score_passing, max_isoforms)]))
+            to_keep = {primary_id}
+            to_keep.update(_[2] for _ in passing)
             self.logger.debug("%d transcripts retained after the check for score and max. no. of isoforms (%d)",
                               len(to_keep), max_isoforms)
 
-            if to_keep == set(self.transcripts.keys()):
-                self.logger.debug("Finished to discard superfluous transcripts from {}".format(self.id))
+            if to_keep == self.transcripts.keys():
+                self.logger.debug("Finished to discard superfluous transcripts from %s", self.id)
             else:
-                for tid in set.difference(set(self.transcripts.keys()), to_keep):
-                    self.logger.debug("Removing %s from %s", tid, self.id)
+                for tid in self.transcripts.keys() - to_keep:
+                    if debug:
+                        self.logger.debug("Removing %s from %s", tid, self.id)
                     self.remove_transcript_from_locus(tid)
                 assert len(self.transcripts) > 0, to_keep
                 self.metrics_calculated = False
@@ -167,7 +263,9 @@ class Locus(Abstractlocus):
             # I am already within a "while" loop. If I find something wrong, I can just "continue"
             with_retained = self._remove_retained_introns()
             if len(with_retained) > 0:
-                self.logger.debug("Transcripts with retained introns: %s", ", ".join(list(with_retained)))
+                if debug:
+                    self.logger.debug("Transcripts with retained introns: %s", ", ".join(with_retained))
+                self.calculate_scores()
             else:
                 self.logger.debug("No transcripts with retained introns found.")
 
@@ -181,8 +279,9 @@ class Locus(Abstractlocus):
 
             break
 
-        self.logger.debug("%s has %d transcripts (%s)", self.id, len(self.transcripts),
-                          ", ".join(list(self.transcripts.keys())))
+        if debug:
+            self.logger.debug("%s has %d transcripts (%s)", self.id, len(self.transcripts),
+                              ", ".join(self.transcripts.keys()))
         self._finalized = True
 
         return
@@ -191,14 +290,15 @@ class Locus(Abstractlocus):
 
         self.logger.debug("Launched padding for %s", self.id)
         failed = False
-        backup = dict()
-        for tid in self.transcripts:
-            backup[tid] = self.transcripts[tid].deepcopy()
+        # pad_transcripts expands copies of the transcripts and leaves the original instances untouched,
+        # so keeping a reference to the latter is sufficient to restore them later.
+        backup = dict(self.transcripts)
+        primary_id = self.primary_transcript_id
 
         # The "templates" are the transcripts that we used to expand the others.
         templates = self.pad_transcripts()
         # First off, let us update the transcripts.
-        for tid in self.transcripts:
+        for tid in list(self.transcripts.keys()):
             self.logger.debug("Swapping %s", tid)
             self._swap_transcript(backup[tid], self.transcripts[tid])
 
@@ -208,17 +308,17 @@ class Locus(Abstractlocus):
 
         self._not_passing = set()
         self._check_requirements()
-        if self.primary_transcript_id in self._not_passing or set.intersection(templates, self._not_passing):
+        if primary_id in self._not_passing or set.intersection(templates, self._not_passing):
             self.logger.debug(
                 "Either the primary or some template transcript has not passed the muster. Removing, restarting.")
-            if self._not_passing == {self.primary_transcript_id}:
+            if self._not_passing == {primary_id}:
                 self.logger.info("The primary transcript %s is invalidated by the other transcripts in the locus.\
-                Leaving only the main transcript in %s.", self.primary_transcript_id, self.id)
-                self._not_passing = set(self.transcripts.keys()) - {self.primary_transcript_id}
+                Leaving only the main transcript in %s.", primary_id, self.id)
+                self._not_passing = self.transcripts.keys() - {primary_id}
             # Templates are clearly wrong. Remove them
-            for tid in self._not_passing - {self.primary_transcript_id}:
+            for tid in self._not_passing - {primary_id}:
                 self.remove_transcript_from_locus(tid)
-            for tid in set(backup.keys()) - (self._not_passing - {self.primary_transcript_id}):
+            for tid in backup.keys() - (self._not_passing - {primary_id}):
                 self.logger.debug("Swapping the old transcript for %s", tid)
                 self._swap_transcript(self.transcripts[tid], backup[tid])
             self.metrics_calculated = False
@@ -228,15 +328,15 @@ class Locus(Abstractlocus):
             return failed
 
         order = sorted([(tid, self.transcripts[tid].score) for tid in self.transcripts
-                        if tid != self.primary_transcript_id],
+                        if tid != primary_id],
                        key=operator.itemgetter(1), reverse=True)
 
         # Now that we are sure that we have not ruined the primary transcript, let us see whether
         # we should discard any other transcript.
-        newlocus = Locus(self.primary_transcript)
+        newlocus = Locus(self.transcripts[primary_id])
         to_remove = set()
         for tid, score in order:
-            if tid == self.primary_transcript_id:
+            if tid == primary_id:
                 continue
             if newlocus.is_alternative_splicing(self.transcripts[tid]):
                 newlocus.add_transcript_to_locus(self.transcripts[tid])
@@ -245,7 +345,7 @@ class Locus(Abstractlocus):
         to_remove.update(newlocus._remove_retained_introns())
         # Now let us check whether we have removed any template transcript.
         # If we have, remove the offending ones and restart
-        if len(set.intersection(set.union(set(templates), {self.primary_transcript_id}), to_remove)) > 0:
+        if not to_remove.isdisjoint(templates | {primary_id}):
             self.transcripts = backup
             [self.remove_transcript_from_locus(tid) for tid in set.intersection(templates, to_remove)]
             self.metrics_calculated = False
@@ -259,28 +359,35 @@ class Locus(Abstractlocus):
     def _remove_retained_introns(self):
         self.logger.debug("Now checking the retained introns for %s", self.id)
         removed = set()
+        keep_retained = self.json_conf["pick"]["alternative_splicing"]["keep_retained_introns"]
+        # The retained introns of a transcript depend only on the introns and the exon/intron graph
+        # of the locus. Transcripts are not modified within this loop, so we can avoid re-analysing
+        # them when removing other transcripts has left the structure of the locus untouched.
+        retained_cache = dict()
         while True:
             to_remove = set()
+            structure = (frozenset(self.introns), frozenset(self._internal_graph.edges()))
             for tid, transcript in self.transcripts.items():
                 if tid == self.primary_transcript_id:
                     continue
-                self.find_retained_introns(transcript)
+                if retained_cache.get(tid) != structure:
+                    self.find_retained_introns(transcript)
+                    retained_cache[tid] = structure
                 if transcript.retained_intron_num > 0:
                     to_remove.add(tid)
                 else:
                     continue
             if not to_remove:
                 break
-            elif self.json_conf["pick"]["alternative_splicing"]["keep_retained_introns"] is False:
-                self.logger.debug("Removing {} because they contain retained introns".format(
-                    ", ".join(list(to_remove))))
+            elif keep_retained is False:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Removing %s because they contain retained introns", ", ".join(to_remove))
                 removed.update(to_remove)
+                # Retained introns depend only on the structure of the locus, not on the scores;
+                # removing the transcripts resets the flags, so the caller can recalculate the scores once.
                 for tid in to_remove:
                     self.remove_transcript_from_locus(tid)
-                self.metrics_calculated = False
-                self.scores_calculated = False
-                self.calculate_scores()
-            elif self.json_conf["pick"]["alternative_splicing"]["keep_retained_introns"] is True:
+            elif keep_retained is True:
                 for tid in to_remove:
                     self.transcripts[tid].attributes["retained_intron"] = True
                 break
@@ -347,7 +454,7 @@ class Locus(Abstractlocus):
             to_be_added = False
 
         if self.json_conf["pick"]["alternative_splicing"]["only_confirmed_introns"] is True:
-            to_check = (transcript.introns - transcript.verified_introns) - self.primary_transcript.introns
+            to_check = (transcript.introns - transcript.verified_introns) - self._primary_introns
             if len(to_check) > 0:
                 self.logger.debug(
                     "%s not added because it has %d non-confirmed intron%s",
@@ -389,23 +496,18 @@ class Locus(Abstractlocus):
     def __check_as_requirements(self, transcript: Transcript) -> bool:
 
         to_be_added = True
-        if ("compiled" not in self.json_conf["as_requirements"] or
-                self.json_conf["as_requirements"]["compiled"] is None):
-            self.json_conf["as_requirements"]["compiled"] = compile(
-                self.json_conf["as_requirements"]["expression"], "<json>",
-                "eval")
-        evaluated = dict()
-        for key in self.json_conf["as_requirements"]["parameters"]:
-            value = rgetattr(transcript,
-                             self.json_conf["as_requirements"]["parameters"][key]["name"])
+        compiled = _compile_expr(self.json_conf["as_requirements"]["expression"])
+        parameters = self.json_conf["as_requirements"]["parameters"]
+
+        def _evaluate(key):
+            value = rgetattr(transcript, parameters[key]["name"])
             if "external" in key:
                 value = value[0]
+            return self.evaluate(value, parameters[key])
 
-            evaluated[key] = self.evaluate(
-                value,
-                self.json_conf["as_requirements"]["parameters"][key])
-            # pylint: disable=eval-used
-        if eval(self.json_conf["as_requirements"]["compiled"]) is False:
+        evaluated = _LazyEvaluated(_evaluate)
+        # pylint: disable=eval-used
+        if eval(compiled) is False:
             self.logger.debug("%s fails the minimum requirements for AS events", transcript.id)
             to_be_added = False
         return to_be_added
@@ -425,33 +527,30 @@ class Locus(Abstractlocus):
         if any(self.transcripts[tid].is_reference is True for tid in self.transcripts):
             return False
 
-        self.json_conf["not_fragmentary"]["compiled"] = compile(
-            self.json_conf["not_fragmentary"]["expression"], "<json>",
-            "eval")
+        compiled = _compile_expr(self.json_conf["not_fragmentary"]["expression"])
+        parameters = self.json_conf["not_fragmentary"]["parameters"]
 
         current_id = self.id[:]
 
-        evaluated = dict()
-        for key in self.json_conf["not_fragmentary"]["parameters"]:
-            value = rgetattr(self.primary_transcript,
-                             self.json_conf["not_fragmentary"]["parameters"][key]["name"])
+        def _evaluate(key):
+            value = rgetattr(self.primary_transcript, parameters[key]["name"])
             if "external" in key:
                 value = value[0]
             try:
-                evaluated[key] = self.evaluate(
-                    value,
-                    self.json_conf["not_fragmentary"]["parameters"][key])
+                return self.evaluate(value, parameters[key])
             except Exception as err:
                 self.logger.error(
                     """Exception while calculating putative fragments. Key: {}, \
                     Transcript value: {} (type {}) \
                     configuration value: {} (type {}).""".format(
-                        key, value, type(value), self.json_conf["not_fragmentary"]["parameters"][key],
-                        type(self.json_conf["not_fragmentary"]["parameters"][key])
+                        key, value, type(value), parameters[key], type(parameters[key])
                     ))
                 self.logger.exception(err)
                 raise err
-        if eval(self.json_conf["not_fragmentary"]["compiled"]) is True:
+
+        evaluated = _LazyEvaluated(_evaluate)
+        # pylint: disable=eval-used
+        if eval(compiled) is True:
             self.logger.debug("%s cannot be a fragment according to the definitions, keeping it",
                               self.id)
             fragment = False
@@ -541,20 +640,21 @@ class Locus(Abstractlocus):
         else:
             transcript = self.transcripts[tid]
             selected = transcript.selected_internal_orf
-            new_transcript = transcript.copy()
+            new_transcript = transcript._shallow_copy()
             new_transcript.id = "{0}.orf1".format(new_transcript.id)
             self.transcripts[new_transcript.id] = new_transcript
             super().calculate_metrics(new_transcript.id)
             self.__orf_doubles[tid].add(new_transcript.id)
 
-            for num, orf in enumerate([_ for _ in transcript.internal_orfs if
-                                       _ != selected]):
-                new_transcript = transcript.copy()
+            # Only the ORF list and the ID differ between the doubles, so we use shallow copies
+            # rather than deep copying the whole transcript for each ORF. ORFs are compared by
+            # identity as they all come from the same list, avoiding element-wise comparisons.
+            orfs = transcript.internal_orfs
+            for num, orf in enumerate([_ for _ in orfs if _ is not selected]):
+                new_transcript = transcript._shallow_copy()
                 assert isinstance(new_transcript, Transcript)
-                new_transcript.internal_orfs = [orf]
-                new_transcript.internal_orfs.extend([_ for _ in transcript.internal_orfs if
-                                                     orf != _])
-                new_transcript.id = "{0}.orf{1}".format(new_transcript.id, num + 2)
+                new_transcript.internal_orfs = [orf] + [_ for _ in orfs if _ is not orf]
+                new_transcript.id = "{0}.orf{1}".format(transcript.id, num + 2)
                 self.transcripts[new_transcript.id] = new_transcript
                 super().calculate_metrics(new_transcript.id)
                 self.__orf_doubles[tid].add(new_transcript.id)
@@ -587,37 +687,51 @@ class Locus(Abstractlocus):
 
     def print_scores(self):
         """This method yields dictionary rows that are given to a csv.DictWriter class."""
-        self.calculate_scores()
+        if self.scores_calculated is False:
+            self.calculate_scores()
         if self.regressor is None:
             score_keys = sorted(list(self.json_conf["scoring"].keys()) + ["source_score"])
         else:
             score_keys = sorted(self.regressor.metrics + ["source_score"])
         keys = ["tid", "alias", "parent", "score"] + score_keys
 
-        for tid in self.scores:
-            row = dict().fromkeys(keys)
+        scores, not_passing = self.scores, frozenset(self._not_passing)
+        aliases = dict((tid, transcript.alias) for tid, transcript in self.transcripts.items())
+        parent = self.id
+
+        calculate_total = (self.regressor is None)
+        if calculate_total is True and len(scores) > 0:
+            # Verify in one go that the partial scores of each transcript add up to its total
+            tids = list(scores.keys())
+            partials = []
+            for tid in tids:
+                tid_partials = [scores[tid][key] for key in score_keys]
+                assert "NA" not in tid_partials and None not in tid_partials, (
+                    tid, [key for key, value in zip(score_keys, tid_partials) if value is None or value == "NA"])
+                partials.append(tid_partials)
+            partials = numpy.array(partials, dtype=numpy.float64)
+            assert not numpy.isnan(partials).any()
+            sums = partials.round(2).sum(axis=1).round(2)
+            totals = numpy.array([scores[tid]["score"] for tid in tids], dtype=numpy.float64).round(2)
+            for tid, score_sum, total in zip(tids, sums, totals):
+                if tid not in not_passing and scores[tid]["score"] > 0:
+                    assert score_sum == total, (score_sum, self.transcripts[tid].score, tid)
+                else:
+                    assert scores[tid]["score"] == 0
+
+        for tid in scores:
+            tid_scores = scores[tid]
+            row = dict.fromkeys(keys)
             row["tid"] = tid
-            row["parent"] = self.id
-            row["alias"] = self.transcripts[tid].alias
-            if tid in self._not_passing:
+            row["parent"] = parent
+            row["alias"] = aliases[tid]
+            if tid in not_passing:
                 row["score"] = 0
             else:
-                row["score"] = round(self.scores[tid]["score"], 2)
-            calculate_total = (self.regressor is None)
-            for key in score_keys:
-                if calculate_total:
-                    assert self.scores[tid][key] != "NA" and self.scores[tid][key] is not None
-                    row[key] = round(self.scores[tid][key], 2)
-
-            if calculate_total is True:
-                score_sum = sum(row[key] for key in score_keys)
-                if tid not in self._not_passing and self.scores[tid]["score"] > 0:
-                    assert round(score_sum, 2) == round(self.scores[tid]["score"], 2), (
-                        score_sum,
-                        self.transcripts[tid].score,
-                        tid)
-                else:
-                    assert self.scores[tid]["score"] == 0
+                row["score"] = round(tid_scores["score"], 2)
+            if calculate_total:
+                for key in score_keys:
+                    row[key] = round(tid_scores[key], 2)
 
             yield row
 
@@ -638,8 +752,10 @@ class Locus(Abstractlocus):
         is_valid = True
         # main_ccode = None
 
-        valid_ccodes = self.json_conf["pick"]["alternative_splicing"]["valid_ccodes"]
-        redundant_ccodes = self.json_conf["pick"]["alternative_splicing"]["redundant_ccodes"]
+        as_conf = self.json_conf["pick"]["alternative_splicing"]
+        valid_ccodes = as_conf["valid_ccodes"]
+        redundant_ccodes = as_conf["redundant_ccodes"]
+        cds_only = self.json_conf["pick"]["clustering"]["cds_only"]
 
         if other.is_coding and not self.primary_transcript.is_coding:
             reason = "{} is coding, and cannot be added to a non-coding locus.".format(other.id)
@@ -653,17 +769,17 @@ class Locus(Abstractlocus):
             main_result = None
 
         else:
-            if self.json_conf["pick"]["clustering"]["cds_only"] is True:
+            if cds_only is True:
                 self.logger.debug("Checking whether the CDS of %s and %s are overlapping enough",
                                   other.id, self.primary_transcript_id)
-                main_result, _ = Assigner.compare(other._selected_orf_transcript,
-                                                  self.primary_transcript._selected_orf_transcript)
+                other_orf, primary_orf = other._selected_orf_transcript, self._primary_selected_orf
+                main_result, _ = Assigner.compare(other_orf, primary_orf)
 
                 enough_overlap, overlap_reason = self._evaluate_transcript_overlap(
-                    other._selected_orf_transcript,
-                    self.primary_transcript._selected_orf_transcript,
-                    min_cdna_overlap=self.json_conf["pick"]["alternative_splicing"]["min_cdna_overlap"],
-                    min_cds_overlap=self.json_conf["pick"]["alternative_splicing"]["min_cds_overlap"],
+                    other_orf,
+                    primary_orf,
+                    min_cdna_overlap=as_conf["min_cdna_overlap"],
+                    min_cds_overlap=as_conf["min_cds_overlap"],
                     comparison=main_result,
                     fixed_perspective=True)
             else:
@@ -672,8 +788,8 @@ class Locus(Abstractlocus):
                 enough_overlap, overlap_reason = self._evaluate_transcript_overlap(
                     other,
                     self.primary_transcript,
-                    min_cdna_overlap=self.json_conf["pick"]["alternative_splicing"]["min_cdna_overlap"],
-                    min_cds_overlap=self.json_conf["pick"]["alternative_splicing"]["min_cds_overlap"],
+                    min_cdna_overlap=as_conf["min_cdna_overlap"],
+                    min_cds_overlap=as_conf["min_cds_overlap"],
                     comparison=main_result,
                     fixed_perspective=True)
 
@@ -692,12 +808,13 @@ class Locus(Abstractlocus):
             is_valid = False
 
         if is_valid:
-            for tid in iter(tid for tid in self.transcripts if
-                            tid not in (self.primary_transcript_id, other.id)):
-                candidate = self.transcripts[tid]
-                if self.json_conf["pick"]["clustering"]["cds_only"] is True:
+            skipped = (self.primary_transcript_id, other.id)
+            for tid, candidate in self.transcripts.items():
+                if tid in skipped:
+                    continue
+                if cds_only is True:
                     result, _ = Assigner.compare(
-                        other._selected_orf_transcript,
+                        other_orf,
                         candidate._selected_orf_transcript)
                 else:
                     result, _ = Assigner.compare(other, candidate)
@@ -722,18 +839,24 @@ class Locus(Abstractlocus):
             if isinstance(self.json_conf["reference"]["genome"], pysam.FastaFile):
                 self.fai = self.json_conf["reference"]["genome"]
             else:
-                self.fai = pysam.FastaFile(self.json_conf["reference"]["genome"])
+                self.fai = _open_genome(self.json_conf["reference"]["genome"], os.getpid())
         except KeyError:
             raise KeyError(self.json_conf.keys())
 
-        five_graph = self.define_graph(objects=self.transcripts, inters=self._share_extreme, three_prime=False)
-        three_graph = self.define_graph(objects=self.transcripts, inters=self._share_extreme, three_prime=True)
+        self.__segment_cache = dict()
+        try:
+            five_graph = self.define_graph(objects=self.transcripts, inters=self._share_extreme, three_prime=False)
+            three_graph = self.define_graph(objects=self.transcripts, inters=self._share_extreme, three_prime=True)
+        finally:
+            self.__segment_cache = None
 
         # TODO: Tie breaks!
 
         __to_modify = self._find_communities_boundaries(five_graph, three_graph)
 
         templates = set()
+        # All the expanded transcripts lie within the locus boundaries: retrieve its sequence only once.
+        fai = _LocusSequence(self.fai, self.chrom, self.start, self.end)
 
         # Now we can do the proper modification
         for tid in __to_modify:
@@ -751,7 +874,7 @@ class Locus(Abstractlocus):
                 new_transcript = expand_transcript(self[tid].deepcopy(),
                                                    __to_modify[tid][0],
                                                    __to_modify[tid][1],
-                                                   self.fai,
+                                                   fai,
                                                    self.logger)
             except KeyboardInterrupt:
                 raise
@@ -764,9 +887,7 @@ class Locus(Abstractlocus):
                 self.logger.debug("Expansion took place for %s!", tid)
             self.transcripts[tid] = new_transcript
 
-        self.exons = set()
-        for tid in self:
-            self.exons.update(self[tid].exons)
+        self.exons = set().union(*(transcript.exons for transcript in self.transcripts.values()))
         # self.fai.close()
         # del self.fai
         return templates
@@ -779,66 +900,74 @@ class Locus(Abstractlocus):
         if inters is None:
             inters = self._share_extreme
 
-        for obj, other_obj in combinations(objects.keys(), 2):
-            self.logger.debug("Comparing %s to %s (%s')", obj, other_obj, "5" if not three_prime else "3")
-            if obj == other_obj:
-                continue
-            else:
-                edge = inters(objects[obj], objects[other_obj], three_prime=three_prime)
-                if edge:
-                    assert edge[0].id in self
-                    assert edge[1].id in self
-                    # assert edge[1].id in self.scores
-                    graph.add_edge(edge[0].id, edge[1].id)
-
+        # The distance checked by the inters function is exonic rather than genomic,
+        # so no pair can be excluded on coordinates alone: keep the loop tight instead,
+        # and add all the edges to the graph at once at the end.
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        end = "5" if not three_prime else "3"
+        edges = []
+        for obj, other_obj in combinations(objects.items(), 2):
+            if debug:
+                self.logger.debug("Comparing %s to %s (%s')", obj[0], other_obj[0], end)
+            edge = inters(obj[1], other_obj[1], three_prime=three_prime)
+            if edge:
+                assert edge[0].id in self
+                assert edge[1].id in self
+                edges.append((edge[0].id, edge[1].id))
+
+        graph.add_edges_from(edges)
         return graph
 
     def _find_communities_boundaries(self, five_graph, three_graph):
 
-        five_found = set()
-
         __to_modify = dict()
 
-        while len(five_graph) > 0:
-            # Find the sinks
-            sinks = {node for node in five_graph.nodes() if node not in
-                     {edge[0] for edge in five_graph.edges()}}
-            __putative = defaultdict(list)
-            for sink in sinks:
-                for ancestor in nx.ancestors(five_graph, sink):
-                    __putative[ancestor].append((sink, self[sink].score))
-
-            for ancestor in __putative:
-                best = sorted(__putative[ancestor], key=operator.itemgetter(1), reverse=True)[0][0]
-                self.logger.debug("Putative 5' for %s: %s. Best: %s", ancestor, __putative[ancestor], best)
-                __to_modify[ancestor] = [self[best], False]
-                five_found.add(ancestor)
-
-            five_graph.remove_nodes_from(set.union(sinks, __putative.keys()))
-
-        three_found = set()
-        while len(three_graph) > 0:
-            sinks = {node for node in three_graph.nodes() if node not in
-                     {edge[0] for edge in three_graph.edges()}}
-            __putative = defaultdict(list)
-            for sink in sinks:
-                for ancestor in nx.ancestors(three_graph, sink):
-                    __putative[ancestor].append((sink, self[sink].score))
-
-            for ancestor in __putative:
-                best = sorted(__putative[ancestor], key=operator.itemgetter(1), reverse=True)[0][0]
-                if ancestor in __to_modify:
-                    __to_modify[ancestor][1] = self[best]
-                else:
-                    __to_modify[ancestor] = [False, self[best]]
-                three_found.add(ancestor)
-                self.logger.debug("Putative 3' for %s: %s. Best: %s", ancestor, __putative[ancestor], best)
-            three_graph.remove_nodes_from(set.union(sinks, __putative.keys()))
+        for ancestor, best in self._find_best_sinks(five_graph).items():
+            self.logger.debug("Best 5' template for %s: %s", ancestor, best)
+            __to_modify[ancestor] = [self[best], False]
+
+        for ancestor, best in self._find_best_sinks(three_graph).items():
+            if ancestor in __to_modify:
+                __to_modify[ancestor][1] = self[best]
+            else:
+                __to_modify[ancestor] = [False, self[best]]
+            self.logger.debug("Best 3' template for %s: %s", ancestor, best)
 
         self.logger.debug("Communities for modifications: %s", __to_modify)
 
         return __to_modify
 
+    def _find_best_sinks(self, graph) -> dict:
+
+        """
+        Private method to find, for each node of the graph with at least one descendant,
+        the highest-scoring sink reachable from it. The graph is visited once, in reverse
+        topological order, peeling off the nodes as all of their successors are processed.
+        :param graph: the directed acyclic graph of the 5' or 3' relationships.
+        :return: a dictionary mapping each ancestor to its best sink.
+        """
+
+        # Work directly on the adjacency views; the graph is never modified here.
+        predecessors = graph.pred
+        out_degree = dict(graph.out_degree())
+        queue = deque(node for node, degree in out_degree.items() if degree == 0)
+        # Running (sink, score) pair for each ancestor; sinks carry their own.
+        best = dict((node, (node, self[node].score)) for node in queue)
+        sinks = set(best)
+
+        while queue:
+            node = queue.popleft()
+            candidate = best[node]
+            for ancestor in predecessors[node]:
+                current = best.get(ancestor)
+                if current is None or candidate[1] > current[1]:
+                    best[ancestor] = candidate
+                out_degree[ancestor] -= 1
+                if out_degree[ancestor] == 0:
+                    queue.append(ancestor)
+
+        return dict((node, pair[0]) for node, pair in best.items() if node not in sinks)
+
     def _share_extreme(self, first: Transcript, second: Transcript, three_prime=False):
 
         """
@@ -864,41 +993,44 @@ class Locus(Abstractlocus):
         reason = None
         ts_splices = 0
         ts_distance = 0
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         if second.start == first.start:
             self.logger.debug("%s and %s start at the same coordinate. No expanding.", first.id, second.id)
             return False
 
         decision = False
-        first, second = sorted([first, second], key=operator.attrgetter("start"))
+        if second.start < first.start:
+            first, second = second, first
         # Now let us check whether the second falls within an intron
-        matched = first.segmenttree.find(second.exons[0][0], second.exons[0][1])
-        self.logger.debug("{second.id} last exon {second.exons[0]} intersects in {first.id}: {matched}".format(
-            **locals()))
+        matched, upstream = self._find_neighbours(first, second.exons[0][0], second.exons[0][1])
+        if debug:
+            self.logger.debug("{second.id} last exon {second.exons[0]} intersects in {first.id}: {matched}".format(
+                **locals()))
         if matched[0].value == "intron" or second.exons[0][0] < matched[0].start:
             decision = False
-            reason = "{second.id} first exon ends within an intron of {first.id}".format(**locals())
+            reason = "{second.id} first exon ends within an intron of {first.id}"
         else:
-            upstream = [_ for _ in first.find_upstream(second.exons[0][0], second.exons[0][1])
-                        if _.value == "exon" and _ not in matched]
             if matched[0][0] < second.start:
                 if upstream:
                     ts_splices += 1
                 ts_distance += second.start - matched[0][0] + 1
-            for up in upstream:
-                if up.start == first.start:
+            for up_start, up_end in upstream:
+                if up_start == first.start:
                     ts_splices += 1
                 else:
                     ts_splices += 2
-                ts_distance += up.end - up.start - 1
+                ts_distance += up_end - up_start - 1
 
         if reason is None:
-            decision = (ts_distance <= self.ts_distance) and (ts_splices <= self.ts_max_splices)
+            max_distance, max_splices = self.ts_distance, self.ts_max_splices
+            decision = (ts_distance <= max_distance) and (ts_splices <= max_splices)
             if decision:
                 decision = (second, first)
-            reason = "{first.id} {doesit} overlap {second.id} (distance {ts_distance} max {self.ts_distance}, splices \
-{ts_splices} max {self.ts_max_splices})".format(doesit="does" if decision else "does not", **locals())
-        self.logger.debug(reason)
+            reason = "{first.id} {doesit} overlap {second.id} (distance {ts_distance} max {max_distance}, splices \
+{ts_splices} max {max_splices})"
+        if debug:
+            self.logger.debug(reason.format(doesit="does" if decision else "does not", **locals()))
         return decision
 
     def _share_three_prime(self, first: Transcript, second: Transcript):
@@ -910,39 +1042,70 @@ class Locus(Abstractlocus):
         reason = None
         ts_splices = 0
         ts_distance = 0
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         decision = False
-        first, second = sorted([first, second], key=operator.attrgetter("end"), reverse=False)
+        if second.end < first.end:
+            first, second = second, first
         # Now let us check whether the second falls within an intron
-        matched = second.segmenttree.find(first.exons[-1][0], first.exons[-1][1])
+        matched, downstream = self._find_neighbours(second, first.exons[-1][0], first.exons[-1][1],
+                                                    three_prime=True)
         if matched[-1].value == "intron" or first.exons[-1][1] > matched[-1].end:
             decision = False
-            reason = "{second.id} last exon ends within an intron of {first.id}".format(**locals())
+            reason = "{second.id} last exon ends within an intron of {first.id}"
         else:
-            downstream = [_ for _ in second.find_downstream(first.exons[-1][0], first.exons[-1][1])
-                          if _.value == "exon" and _ not in matched]
-
             if matched[-1][1] > first.end:
                 if downstream:
                     ts_splices += 1
                 ts_distance += matched[-1][1] - first.end + 1
 
-            for down in downstream:
-                if down.end == second.end:
+            for down_start, down_end in downstream:
+                if down_end == second.end:
                     ts_splices += 1
                 else:
                     ts_splices += 2
-                ts_distance += down.end - down.start - 1
+                ts_distance += down_end - down_start - 1
 
         if reason is None:
-            decision = (ts_distance <= self.ts_distance) and (ts_splices <= self.ts_max_splices)
+            max_distance, max_splices = self.ts_distance, self.ts_max_splices
+            decision = (ts_distance <= max_distance) and (ts_splices <= max_splices)
             if decision:
                 decision = (first, second)
             reason = "{second.id} {doesit} overlap {first.id} (distance {ts_distance} max \
-{self.ts_distance}, splices {ts_splices} max {self.ts_max_splices})".format(
-                doesit="does" if decision else "does not", **locals())
-        self.logger.debug(reason)
+{max_distance}, splices {ts_splices} max {max_splices})"
+        if debug:
+            self.logger.debug(reason.format(doesit="does" if decision else "does not", **locals()))
         return decision
 
+    def _find_neighbours(self, transcript: Transcript, start: int, end: int, three_prime=False):
+
+        """
+        Private method to retrieve the segments of a transcript intersecting the given exon, together with
+        the exons of the transcript upstream (or downstream, if three_prime is True) of it.
+        The results are memoized for the duration of pad_transcripts, as transcripts sharing their
+        terminal exon would otherwise repeat the same queries against the same template.
+        :param transcript: the transcript whose segment tree will be queried.
+        :param start: start of the exon.
+        :param end: end of the exon.
+        :param three_prime: boolean flag. If True, look for downstream rather than upstream exons.
+        :return: the list of matched segments and the list of neighbouring exons.
+        """
+
+        key = (transcript, start, end, three_prime)
+        cache = self.__segment_cache
+        if cache is not None and key in cache:
+            return cache[key]
+
+        matched = transcript.segmenttree.find(start, end)
+        # Exons lying completely outside of the interval cannot be among the matched segments,
+        # and can be read directly from the exon list rather than from the segment tree.
+        if three_prime:
+            neighbours = [exon for exon in transcript.exons if exon[0] > end]
+        else:
+            neighbours = [exon for exon in transcript.exons if exon[1] < start]
+        if cache is not None:
+            cache[key] = (matched, neighbours)
+        return matched, neighbours
+
     @property
     def __name__(self):
         if len(self.transcripts) == 0:
@@ -989,29 +1152,27 @@ class Locus(Abstractlocus):
         if string == self.__id:
             return
         primary_id = "{0}.1".format(string)
-        old_primary = self.primary_transcript.id
-        self.primary_transcript.attributes["Alias"] = self.primary_transcript.id
-        self.primary_transcript.id = primary_id
-        self.transcripts[primary_id] = self.primary_transcript
+        primary = self.primary_transcript
+        old_primary = primary.id
+        primary.attributes["Alias"] = old_primary
+        primary.id = primary_id
         self.primary_transcript_id = primary_id
-        del self.transcripts[old_primary]
-
-        order = sorted([k for k in self.transcripts.keys() if k != primary_id],
-                       key=lambda xtid: self.transcripts[xtid])
 
+        # Rebuild the dictionary in one pass, with the primary first and the others in sorted order
+        transcripts = {primary_id: primary}
         mapper = {old_primary: primary_id}
-
-        for counter, tid in enumerate(order):
-            counter += 2
-            self.transcripts[tid].attributes["Alias"] = tid
+        order = sorted(((tid, transcript) for tid, transcript in self.transcripts.items() if tid != old_primary),
+                       key=operator.itemgetter(1))
+        for counter, (tid, transcript) in enumerate(order, 2):
+            transcript.attributes["Alias"] = tid
             new_id = "{0}.{1}".format(string, counter)
-            self.transcripts[tid].id = new_id
-            self.transcripts[new_id] = self.transcripts.pop(tid)
+            transcript.id = new_id
+            transcripts[new_id] = transcript
             mapper[tid] = new_id
+        self.transcripts = transcripts
 
         if self.scores_calculated is True:
-            for tid in mapper:
-                self.scores[mapper[tid]] = self.scores.pop(tid)
+            self.scores = dict((mapper.get(tid, tid), score) for tid, score in self.scores.items())
         if self.metrics_calculated is True:
             for index in range(len(self.metric_lines_store)):
                 self.metric_lines_store[index]["tid"] = mapper[self.metric_lines_store[index]["tid"]]
@@ -1051,6 +1212,26 @@ class Locus(Abstractlocus):
 
         return self.transcripts[self.primary_transcript_id]
 
+    def __primary_properties(self):
+        """Private method to retrieve the selected ORF and the introns of the primary transcript.
+        These are requested for every candidate isoform, so they are cached for as long as the
+        primary transcript instance stays the same (padding, for example, replaces it)."""
+
+        primary = self.primary_transcript
+        if self.__primary_cache is None or self.__primary_cache[0] is not primary:
+            self.__primary_cache = (primary, primary._selected_orf_transcript, frozenset(primary.introns))
+        return self.__primary_cache
+
+    @property
+    def _primary_selected_orf(self):
+        """The selected ORF of the primary transcript, as a transcript object."""
+        return self.__primary_properties()[1]
+
+    @property
+    def _primary_introns(self):
+        """The introns of the primary transcript."""
+        return self.__primary_properties()[2]
+
     @property
     def purge(self):
 
@@ -1118,8 +1299,9 @@ def expand_transcript(transcript: Transcript,
     # Remove the CDS and unfinalize
     logger.debug("Starting expansion of %s", transcript.id)
     strand = transcript.strand
-    transcript.strip_cds()
+    # No need to finalise the stripped transcript, we are going to modify it straight away
     transcript.unfinalize()
+    transcript.strip_cds(finalize=False)
     assert strand == transcript.strand
     downstream = 0
     down_exons = []
@@ -1201,6 +1383,15 @@ Aborting.".format(transcript.id, backup.strand, transcript.combined_cds_start, t
     return transcript
 
 
+def _exons_length(exons) -> int:
+
+    """Private function to calculate the cumulative length of a list of exons.
+    :param exons: a list of (start, end) tuples.
+    """
+
+    return sum(end - start + 1 for start, end in exons)
+
+
 def _enlarge_start(transcript: Transcript,
                    backup: Transcript,
                    start_transcript: Transcript) -> (int, list, [None, tuple], bool):
@@ -1222,19 +1413,19 @@ def _enlarge_start(transcript: Transcript,
     to_remove = False
     if start_transcript:
         transcript.start = start_transcript.start
-        upstream_exons = sorted([_ for _ in
-            start_transcript.find_upstream(transcript.exons[0][0], transcript.exons[0][1])
-                                      if _.value == "exon"])
+        # The exons of the (finalised) template are sorted: no need to query its segment tree.
+        upstream_exons = [exon for exon in start_transcript.exons if exon[1] < transcript.exons[0][0]]
 
-        intersecting_upstream = sorted(start_transcript.search(
-            transcript.exons[0][0], transcript.exons[0][1]))
+        intersecting_upstream = start_transcript.search(transcript.exons[0][0], transcript.exons[0][1])
 
         if not intersecting_upstream:
             raise KeyError("No exon or intron found to be intersecting with %s vs %s, this is a mistake",
                            transcript.id, start_transcript.id)
+        # We are taking the left-most intersecting element.
+        first_intersecting = min(intersecting_upstream)
 
-        if intersecting_upstream[0].value == "exon":
-            new_first_exon = (min(intersecting_upstream[0][0], backup.start),
+        if first_intersecting.value == "exon":
+            new_first_exon = (min(first_intersecting[0], backup.start),
                               transcript.exons[0][1])
             if new_first_exon != transcript.exons[0]:
                 upstream += backup.start - new_first_exon[0]
@@ -1242,17 +1433,17 @@ def _enlarge_start(transcript: Transcript,
                 to_remove = True
             else:
                 new_first_exon = None
-            if intersecting_upstream[0] in upstream_exons:
-                upstream_exons.remove(intersecting_upstream[0])
-            upstream += sum(_[1] - _[0] + 1 for _ in upstream_exons)
-            up_exons.extend([(_[0], _[1]) for _ in upstream_exons])
-        elif intersecting_upstream[0].value == "intron":
+            # If the intersecting exon was also found upstream, it can only be the closest one
+            if upstream_exons and upstream_exons[-1] == (first_intersecting.start, first_intersecting.end):
+                upstream_exons.pop()
+            upstream += _exons_length(upstream_exons)
+            up_exons.extend(upstream_exons)
+        elif first_intersecting.value == "intron":
             # Now we have to expand until the first exon in the upstream_exons
             if upstream_exons:
                 to_remove = True
-                upstream_exon = upstream_exons[-1]
+                upstream_exon = upstream_exons.pop()
                 new_first_exon = (upstream_exon[0], transcript.exons[0][1])
-                upstream_exons.remove(upstream_exon)
                 upstream += backup.start - new_first_exon[0]
                 up_exons.append(new_first_exon)
             else:
@@ -1268,8 +1459,8 @@ def _enlarge_start(transcript: Transcript,
                 else:
                     pass
 
-            upstream += sum(_[1] - _[0] + 1 for _ in upstream_exons)
-            up_exons.extend([(_[0], _[1]) for _ in upstream_exons])
+            upstream += _exons_length(upstream_exons)
+            up_exons.extend(upstream_exons)
 
     return upstream, up_exons, new_first_exon, to_remove
 
@@ -1301,18 +1492,16 @@ def _enlarge_end(transcript: Transcript,
 
     if end_transcript:
         transcript.end = end_transcript.end
-        downstream_exons = sorted([_ for _ in
-                                    end_transcript.find_downstream(transcript.exons[-1][0], transcript.exons[-1][1])
-                                    if _.value == "exon"])
-        intersecting_downstream = sorted(end_transcript.search(
-            transcript.exons[-1][0], transcript.exons[-1][1]))
+        downstream_exons = [exon for exon in end_transcript.exons if exon[0] > transcript.exons[-1][1]]
+        intersecting_downstream = end_transcript.search(transcript.exons[-1][0], transcript.exons[-1][1])
         if not intersecting_downstream:
             raise KeyError("No exon or intron found to be intersecting with %s vs %s, this is a mistake",
                            transcript.id, end_transcript.id)
         # We are taking the right-most intersecting element.
-        if intersecting_downstream[-1].value == "exon":
+        last_intersecting = max(intersecting_downstream)
+        if last_intersecting.value == "exon":
             if transcript.monoexonic and new_first_exon is not None:
-                new_exon = (new_first_exon[0], max(intersecting_downstream[-1][1], new_first_exon[1]))
+                new_exon = (new_first_exon[0], max(last_intersecting[1], new_first_exon[1]))
                 if new_exon != new_first_exon:
                     up_exons.remove(new_first_exon)
                     downstream += new_exon[1] - backup.end
@@ -1320,17 +1509,18 @@ def _enlarge_end(transcript: Transcript,
                     to_remove = True
             else:
                 new_exon = (transcript.exons[-1][0],
-                            max(intersecting_downstream[-1][1], transcript.exons[-1][1]))
+                            max(last_intersecting[1], transcript.exons[-1][1]))
                 if new_exon != transcript.exons[-1]:
                     downstream += new_exon[1] - backup.end
                     down_exons.append(new_exon)
                     to_remove = True
 
-            if intersecting_downstream[-1] in downstream_exons:
-                downstream_exons.remove(intersecting_downstream[-1])
-            downstream += sum(_[1] - _[0] + 1 for _ in downstream_exons)
-            down_exons.extend([(_[0], _[1]) for _ in downstream_exons])
-        elif intersecting_downstream[-1].value == "intron":
+            # If the intersecting exon was also found downstream, it can only be the closest one
+            if downstream_exons and downstream_exons[0] == (last_intersecting.start, last_intersecting.end):
+                del downstream_exons[0]
+            downstream += _exons_length(downstream_exons)
+            down_exons.extend(downstream_exons)
+        elif last_intersecting.value == "intron":
             # Now we have to expand until the first exon in the upstream_exons
             if downstream_exons:
                 downstream_exon = downstream_exons[0]
@@ -1343,7 +1533,7 @@ def _enlarge_end(transcript: Transcript,
                 else:
                     new_exon = (transcript.exons[-1][0], downstream_exon[1])
                     to_remove = True
-                downstream_exons.remove(downstream_exon)
+                del downstream_exons[0]
                 downstream += new_exon[1] - backup.end
                 down_exons.append(new_exon)
             else:
@@ -1356,8 +1546,8 @@ def _enlarge_end(transcript: Transcript,
                     raise ValueError(
                         "Something has gone wrong. We should have found the correct exons."
                     )
-            downstream += sum(_[1] - _[0] + 1 for _ in downstream_exons)
-            down_exons.extend([(_[0], _[1]) for _ in downstream_exons])
+            downstream += _exons_length(downstream_exons)
+            down_exons.extend(downstream_exons)
 
     return downstream, up_exons, down_exons, to_remove
 
@@ -1377,9 +1567,11 @@ def check_expanded(transcript, backup, start_transcript, end_transcript, fai, up
     :returns: the cDNA of the modified transcript, as a standard Python string.
     """
 
-    assert transcript.exons != backup.exons
+    # Expansion only ever moves the outer boundaries, so comparing them is enough to tell the exons apart.
+    assert (transcript.start, transcript.end) != (backup.start, backup.end), (transcript.start, transcript.end)
 
-    assert transcript.end <= len(fai[transcript.chrom]), (transcript.end, len(fai[transcript.chrom]))
+    chrom_length = fai.get_reference_length(transcript.chrom)
+    assert transcript.end <= chrom_length, (transcript.end, chrom_length)
     genome_seq = fai.fetch(transcript.chrom, transcript.start - 1, transcript.end)
 
     if not (transcript.exons[-1][1] - transcript.start + 1 == len(genome_seq)):
@@ -1388,28 +1580,44 @@ def check_expanded(transcript, backup, start_transcript, end_transcript, fai, up
                              transcript.start, transcript.end, len(genome_seq))
         logger.error(error)
         raise InvalidTranscript(error)
-    seq = TranscriptChecker(transcript, genome_seq, is_reference=True).cdna
+    # Splice the exons directly out of the genomic sequence; no checks on the transcript are needed here.
+    offset = transcript.start
+    seq = "".join([genome_seq[exon[0] - offset:exon[1] + 1 - offset] for exon in transcript.exons])
+    if transcript.strand == "-":
+        seq = TranscriptChecker.rev_complement(seq)
     assert len(seq) == transcript.cdna_length, (len(seq), transcript.cdna_length, transcript.exons)
     if not len(seq) == backup.cdna_length + upstream + downstream:
-        error = [len(seq), backup.cdna_length + upstream + downstream,
-                 backup.cdna_length, upstream, downstream,
-                 (transcript.start, transcript.end), (backup.id, backup.start, backup.end),
-                 (None if not start_transcript else (start_transcript.id, (start_transcript.start,
-                                                                           start_transcript.end))),
-                 (None if not end_transcript else (end_transcript.id, (end_transcript.start,
-                                                                       end_transcript.end))),
-                 (backup.id, backup.exons),
-                 None if not start_transcript else (start_transcript.id, start_transcript.exons),
-                 None if not end_transcript else (end_transcript.id, end_transcript.exons),
-                 (transcript.id + "_expanded", transcript.exons),
-                 set.difference(set(transcript.exons), set(backup.exons)),
-                 set.difference(set(backup.exons), set(transcript.exons))
-                 ]
-        error = "\n".join([str(_) for _ in error])
-        raise AssertionError(error)
+        raise AssertionError(_expansion_error(transcript, backup, start_transcript, end_transcript,
+                                              seq, upstream, downstream))
     return seq
 
 
+def _expansion_error(transcript, backup, start_transcript, end_transcript, seq, upstream, downstream) -> str:
+
+    """
+    Private function to build the diagnostic message for a transcript whose expanded cDNA does not have
+    the expected length. It is only called when the check fails.
+    :returns: the error message, with one piece of information per line.
+    """
+
+    expanded_exons, original_exons = set(transcript.exons), set(backup.exons)
+    error = [len(seq), backup.cdna_length + upstream + downstream,
+             backup.cdna_length, upstream, downstream,
+             (transcript.start, transcript.end), (backup.id, backup.start, backup.end),
+             (None if not start_transcript else (start_transcript.id, (start_transcript.start,
+                                                                       start_transcript.end))),
+             (None if not end_transcript else (end_transcript.id, (end_transcript.start,
+                                                                   end_transcript.end))),
+             (backup.id, backup.exons),
+             None if not start_transcript else (start_transcript.id, start_transcript.exons),
+             None if not end_transcript else (end_transcript.id, end_transcript.exons),
+             (transcript.id + "_expanded", transcript.exons),
+             expanded_exons - original_exons,
+             original_exons - expanded_exons
+             ]
+    return "\n".join([str(_) for _ in error])
+
+
 def enlarge_orfs(transcript: Transcript,
                  backup: Transcript,
                  seq: str,
@@ -1442,12 +1650,16 @@ def enlarge_orfs(transcript: Transcript,
     if not internal_orfs:
         return transcript
 
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Sequence for %s: %s[..]%s (upstream %s, downstream %s)",
+                     transcript.id, seq[:10], seq[-10:], upstream, downstream)
+
     new_orfs = []
     for orf in internal_orfs:
-        logger.debug("Old ORF: %s", str(orf))
+        if debug:
+            logger.debug("Old ORF: %s", str(orf))
         try:
-            logger.debug("Sequence for %s: %s[..]%s (upstream %s, downstream %s)",
-                         transcript.id, seq[:10], seq[-10:], upstream, downstream)
             orf.expand(seq, upstream, downstream, expand_orf=True, logger=logger)
         except AssertionError as err:
             logger.error(err)
@@ -1457,7 +1669,8 @@ def enlarge_orfs(transcript: Transcript,
                          transcript.exons,
                          transcript.cdna_length)
             raise AssertionError(err)
-        logger.debug("New ORF: %s", str(orf))
+        if debug:
+            logger.debug("New ORF: %s", str(orf))
         if orf.coding is False:
             raise ValueError(orf)
         elif orf.invalid:
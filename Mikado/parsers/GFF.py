@@ -45,7 +45,7 @@ class GffLine(GFAnnotation):
 
         self.attribute_order = []
 
-        infolist = re.findall(self._attribute_pattern, self._attr.rstrip().rstrip(";"))
+        infolist = self._attribute_pattern.findall(self._attr.rstrip().rstrip(";"))
 
         for item in infolist:
             key, val = item
@@ -54,16 +54,18 @@ class GffLine(GFAnnotation):
             elif key.upper() == "ID":
                 self.id = val
             else:
-                try:
-                    val = int(val)
-                except ValueError:
+                # A value starting with a letter can only be a number if it is "inf" or "nan":
+                # do not pay for two failed conversions on every textual attribute
+                if not (val[:1].isalpha() and val[:1] not in "iInN"):
                     try:
-                        val = float(val)
+                        val = int(val)
                     except ValueError:
-                        pass
-                finally:
-                    self.attributes[key] = val
-                    self.attribute_order.append(key)
+                        try:
+                            val = float(val)
+                        except ValueError:
+                            pass
+                self.attributes[key] = val
+                self.attribute_order.append(key)
 
     def _format_attributes(self):
         """
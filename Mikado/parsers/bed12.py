@@ -6,16 +6,16 @@ but at the same time more pythonic.
 """
 
 
-import random
 import os
 from Bio import Seq
 import Bio.SeqRecord
 from . import Parser
 from sys import intern
 import copy
+import functools
+import re
 from ..parsers.GFF import GffLine
 from typing import Union
-import re
 from ..utilities.log_utils import create_null_logger
 from Bio.Data import CodonTable
 import pysam
@@ -23,6 +23,84 @@ import pysam
 standard = CodonTable.ambiguous_dna_by_id[1]
 standard.start_codons = ["ATG"]
 
+_immutables = (str, bytes, int, float, bool, type(None))
+
+
+@functools.lru_cache(maxsize=None)
+def _codon_sets(table):
+    """Return the start and stop codons of a codon table as frozensets, followed by their reverse complements,
+    so that codon scans on either strand are set lookups and never reverse complement each codon."""
+
+    start_codons, stop_codons = frozenset(table.start_codons), frozenset(table.stop_codons)
+    return (start_codons, stop_codons,
+            frozenset(Seq.reverse_complement(codon) for codon in start_codons),
+            frozenset(Seq.reverse_complement(codon) for codon in stop_codons))
+
+
+_unambiguous = frozenset("ACGT")
+_unambiguous_any_case = frozenset("ACGTacgt")
+
+
+@functools.lru_cache(maxsize=None)
+def _stop_codon_pattern(table):
+    """Return a regular expression finding, with overlaps, the unambiguous codons of a table which Biopython would
+    translate as stops (i.e. excluding those which also code for an amino acid), ignoring case.
+    None if there are none."""
+
+    stops = sorted(codon for codon in table.stop_codons
+                   if _unambiguous.issuperset(codon) and codon not in table.forward_table)
+    if not stops:
+        return None
+    return re.compile("(?=({}))".format("|".join(stops)), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _reversed_start_codon_pattern(table):
+    """Return a regular expression finding, with overlaps and ignoring case, the start codons of a table in a
+    *reversed* (not complemented) sequence, so that the nearest upstream start codon is the first match."""
+
+    return re.compile("(?=({}))".format("|".join(sorted(codon[::-1] for codon in _codon_sets(table)[0]))),
+                      re.IGNORECASE)
+
+
+def _count_stop_codons(sequence, table, end):
+    """Count the in-frame stop codons of sequence[:end], like counting "*" in its translation would.
+    Plain ACGT sequences are searched directly, without copying them; anything else is left to Biopython."""
+
+    if not _unambiguous.issuperset(sequence):
+        sequence = sequence[:end].upper()
+        end = len(sequence)
+        if not _unambiguous.issuperset(sequence):
+            return str(Seq.translate(sequence, table=table, gap='N')).count("*")
+    pattern = _stop_codon_pattern(table)
+    if pattern is None:
+        return 0
+    return sum(1 for match in pattern.finditer(sequence, 0, end) if match.start() % 3 == 0)
+
+
+def _first_in_frame(pattern, sequence, start):
+    """Return the position of the first match of a codon pattern in frame with start, or None."""
+
+    if pattern is not None:
+        for match in pattern.finditer(sequence, start):
+            if (match.start() - start) % 3 == 0:
+                return match.start()
+    return None
+
+
+def _find_stop_codon(sequence, table, start=0):
+    """Return the position of the first stop codon of sequence in frame with start, or None if there is none.
+    The sequence is searched in place, which is only valid if everything before the hit is plain ACGT (in either
+    case); otherwise it is left to Biopython."""
+
+    stop_pos = _first_in_frame(_stop_codon_pattern(table), sequence, start)
+    if _unambiguous_any_case.issuperset(sequence[start:stop_pos]):
+        return stop_pos
+    coding = sequence[start:]
+    # No to_stop here: Biopython refuses it for tables with codons which are both stops and amino acids
+    stop_pos = str(Seq.translate(coding[:len(coding) - len(coding) % 3], table=table, gap="N")).find("*")
+    return None if stop_pos < 0 else start + stop_pos * 3
+
 # import numpy as np
 
 
@@ -34,9 +112,20 @@ class BED12:
     BED12 parsing class.
     """
 
-    __valid_coding = {"True": True, "False": False, True: True, False: False}
-
-    _attribute_pattern = re.compile(r"([^;]*)=([^$=]*)(?:;|$)")
+    _line_template = "\t".join(["{}"] * 12)
+
+    # BED12 objects are created by the million when parsing ORF files, so keep their attributes in slots.
+    # Private attributes are listed with their mangled names; "__dict__" is kept so that other attributes can
+    # still be set, but the dictionary is only allocated for the instances which need it.
+    __slots__ = ("_line", "_fields", "header", "chrom", "start", "end", "name", "score", "rgb",
+                 "thick_start", "thick_end", "block_count", "invalid_reason", "fasta_length",
+                 "max_regression", "start_adjustment", "coding", "alias", "attribute_order",
+                 "start_codon", "stop_codon", "validity_checked", "query",
+                 "_BED12__phase", "_BED12__has_start", "_BED12__has_stop", "_BED12__transcriptomic",
+                 "_BED12__parent", "_BED12__strand", "_BED12__max_regression", "_BED12__internal_stop_codons",
+                 "_BED12__in_index", "_BED12__table", "_BED12__table_index", "_BED12__lenient",
+                 "_BED12__block_sizes", "_BED12__raw_block_sizes", "_BED12__block_starts",
+                 "_BED12__raw_block_starts", "__dict__")
 
     def __init__(self, *args: Union[str, list, tuple, GffLine],
                  fasta_index=None,
@@ -274,16 +363,36 @@ class BED12:
 
     def __getstate__(self):
 
-        state = copy.deepcopy(dict((key, val) for key, val in self.__dict__.items()
-                                   if key not in ("_BED12_table") and
-                                   not isinstance(val, CodonTable.CodonTable)))
+        # Most of the state is made of immutable values or flat lists of them (block sizes and starts, fields,
+        # parents); copy those directly and fall back to deepcopy only for anything else.
+        state = dict()
+        items = [(key, getattr(self, key)) for key in self.__slots__[:-1] if hasattr(self, key)]
+        items.extend(self.__dict__.items())
+        for key, val in items:
+            if isinstance(val, CodonTable.CodonTable):
+                continue
+            elif isinstance(val, _immutables):
+                state[key] = val
+            elif isinstance(val, list) and all(isinstance(item, _immutables) for item in val):
+                state[key] = val[:]
+            else:
+                state[key] = copy.deepcopy(val)
         return state
 
     def __setstate__(self, state):
         # del state["table"]
-        self.__dict__.update(state)
+        for key, val in state.items():
+            setattr(self, key, val)
         self.table = self.__table_index
 
+    def __deepcopy__(self, memodict=None):
+        # __getstate__ already returns an independent copy of the instance dictionary
+        new = self.__class__.__new__(self.__class__)
+        if memodict is not None:
+            memodict[id(self)] = new
+        new.__setstate__(self.__getstate__())
+        return new
+
     def _parse_attributes(self, attributes):
 
         """
@@ -293,22 +402,25 @@ class BED12:
 
         self.attribute_order = []
 
-        infolist = re.findall(self._attribute_pattern, attributes.rstrip().rstrip(";"))
-
-        for item in infolist:
-            key, val = item
-            if key.lower() in ("parent", "geneid"):
+        # The attributes are simple key=value pairs, so splitting is much cheaper than a regular expression
+        for item in attributes.rstrip().rstrip(";").split(";"):
+            key, sep, val = item.partition("=")
+            if not sep:
+                continue
+            key = key.lower()
+            if key in ("parent", "geneid"):
                 self.parent = val
-            elif "phase" in key.lower():
+            elif "phase" in key:
                 self.phase = int(val)
                 self.coding = True
-            elif key.lower() == "coding":
-                self.coding = self.__valid_coding.get(val, False)
+            elif key == "coding":
+                # Only the literal "True" written by Mikado marks an ORF as coding
+                self.coding = (val == "True")
                 if self.transcriptomic is True:
                     self.phase = 0
-            elif key.lower() == "alias":
+            elif key == "alias":
                 self.alias = val
-            elif key.lower() == "id":
+            elif key == "id":
                 self.name = val
             else:
                 continue
@@ -332,16 +444,20 @@ class BED12:
         self.thick_start = int(self.thick_start) + 1
         self.thick_end = int(self.thick_end)
         self.block_count = int(self.block_count)
+        # Block strings are only converted to integers when first accessed, see the block_sizes/block_starts
+        # properties; many uses of a BED12 never look at its blocks.
         if isinstance(block_sizes, (str, bytes)):
-            self.block_sizes = [int(x) for x in block_sizes.split(",") if x]
+            self.__block_sizes, self.__raw_block_sizes = None, block_sizes
         else:
             self.block_sizes = [int(x) for x in block_sizes]
         if isinstance(block_starts, (str, bytes)):
-            self.block_starts = [int(x) for x in block_starts.split(",") if x]
+            self.__block_starts, self.__raw_block_starts = None, block_starts
         else:
             self.block_starts = [int(x) for x in block_starts]
-        self._parse_attributes(self.name)
-        if len(self._fields) == 13:
+        # Plain names carry no attributes, and a 13th column identical to the name would set the same values again
+        if "=" in self.name:
+            self._parse_attributes(self.name)
+        if len(self._fields) == 13 and "=" in self._fields[-1] and self._fields[-1] != self._fields[3]:
             self._parse_attributes(self._fields[-1])
         self.has_start_codon = None
         self.has_stop_codon = None
@@ -407,8 +523,9 @@ class BED12:
                     self.__in_index = False
                     return
 
-                self.fasta_length = len(fasta_index[self.id])
+                # Retrieve the sequence only once; with pysam, each lookup reads it again from the file
                 sequence = fasta_index[self.id]
+                self.fasta_length = len(sequence)
                 if hasattr(sequence, "seq"):
                     sequence = str(sequence.seq)
                 if not isinstance(sequence, str):
@@ -428,10 +545,12 @@ class BED12:
                     sequence[(self.thick_start - 1):(
                         self.thick_end if not self.phase else self.end - (3 - self.phase) % 3)])
 
-            self.start_codon = str(orf_sequence)[:3].upper()
-            self.stop_codon = str(orf_sequence[-3:]).upper()
+            # orf_sequence is already a str on both strands
+            self.start_codon = orf_sequence[:3].upper()
+            self.stop_codon = orf_sequence[-3:].upper()
+            start_codons, stop_codons = _codon_sets(self.table)[:2]
 
-            if self.start_codon in self.table.start_codons and (self.phase is None or self.phase == 0):
+            if self.start_codon in start_codons and (self.phase is None or self.phase == 0):
                 self.has_start_codon = True
                 self.phase = 0
             else:
@@ -444,7 +563,7 @@ class BED12:
                     #     sequence = Seq.reverse_complement(sequence)
                     self._adjust_start(sequence, orf_sequence)
 
-            if self.stop_codon in self.table.stop_codons:
+            if self.stop_codon in stop_codons:
                 self.has_stop_codon = True
             else:
                 self.has_stop_codon = False
@@ -452,12 +571,11 @@ class BED12:
                 if self.end - self.thick_end <= 2:
                     self.thick_end = self.end
 
-            # Get only a proper multiple of three
-            last_pos = -3 - ((len(orf_sequence)) % 3)
+            # Get only a proper multiple of three, excluding the final codon
+            last_pos = max(len(orf_sequence) - 3 - len(orf_sequence) % 3, 0)
 
             if self.__lenient is False:
-                translated_seq = Seq.translate(orf_sequence[:last_pos], table=self.table, gap='N')
-                self.__internal_stop_codons = str(translated_seq).count("*")
+                self.__internal_stop_codons = _count_stop_codons(orf_sequence, self.table, last_pos)
 
             if self.invalid is True:
                 return
@@ -467,13 +585,15 @@ class BED12:
         assert len(orf_sequence) == (self.thick_end - self.thick_start + 1)
         # Let's check UPstream first.
         # This means that we DO NOT have a starting Met and yet we are starting far upstream.
+        start_codons, stop_codons, rc_start_codons, rc_stop_codons = _codon_sets(self.table)
         if self.strand == "+" and self.thick_start > 3:
             for pos in range(self.thick_start, 3, -3):
                 self.thick_start -= 3
-                if sequence[pos - 3:pos] in self.table.start_codons:
+                codon = sequence[pos - 3:pos]
+                if codon in start_codons:
                     # We have found a valid methionine.
                     break
-                elif sequence[pos - 3:pos] in self.table.stop_codons:
+                elif codon in stop_codons:
                     self.thick_start += 3
                     break
                 continue
@@ -481,18 +601,18 @@ class BED12:
         elif self.strand == "-" and self.end - self.thick_end > 3:
             for pos in range(self.thick_end, self.end - 3, 3):
                 self.thick_end += 3
-                if Seq.reverse_complement(sequence[pos - 3:pos]) in self.table.start_codons:
+                codon = sequence[pos - 3:pos]
+                if codon in rc_start_codons:
                     # We have found a valid methionine.
                     break
-                elif Seq.reverse_complement(sequence[pos - 3:pos]) in self.table.stop_codons:
+                elif codon in rc_stop_codons:
                     self.thick_end -= 3
                     break
-            print("Thick end:", self.thick_end)
         else:
             for pos in range(3,
                              int(len(orf_sequence) * self.max_regression),
                              3):
-                if orf_sequence[pos:pos + 3] in self.table.start_codons:
+                if orf_sequence[pos:pos + 3] in start_codons:
                     # Now we have to shift the start accordingly
                     self.has_start_codon = True
                     if self.strand == "+":
@@ -503,7 +623,6 @@ class BED12:
                     break
                 else:
                     continue
-            print("Thick end:", self.thick_end)
 
         if self.has_start_codon is False:
             # The validity will be automatically checked
@@ -535,45 +654,30 @@ class BED12:
             else:
                 return "#"
 
-        line = [self.chrom, self.start - 1, self.end]
-
         if self.transcriptomic is True:
             name = "ID={};coding={}".format(self.id, self.coding)
             if self.coding:
                 name += ";phase={}".format(self.phase)
             if self.alias is not None and self.alias != self.id:
                 name += ";alias={}".format(self.alias)
-
-            line.append(name)
         else:
-            line.append(self.name)
+            name = self.name
 
-        if not self.score:
-            line.append(0)
-        else:
-            line.append(self.score)
-        if self.strand is None:
-            line.append(".")
-        else:
-            line.append(self.strand)
-        line.extend([self.thick_start - 1, self.thick_end])
-        if not self.rgb:
-            line.append(0)
-        else:
-            line.append(self.rgb)
-        line.append(self.block_count)
-        line.append(",".join([str(x) for x in self.block_sizes]))
-        line.append(",".join([str(x) for x in self.block_starts]))
-        return "\t".join([str(x) for x in line])
+        # A single format call, rather than building a list and converting each field separately
+        return self._line_template.format(
+            self.chrom, self.start - 1, self.end, name,
+            self.score or 0, self.strand or ".",
+            self.thick_start - 1, self.thick_end, self.rgb or 0, self.block_count,
+            ",".join([str(x) for x in self.block_sizes]), ",".join([str(x) for x in self.block_starts]))
 
     def __eq__(self, other):
-        for key in ["chrom", "strand", "start",
-                    "end", "thick_start", "thick_end",
-                    "block_count", "block_sizes",
-                    "block_starts"]:
-            if getattr(self, key) != getattr(other, key):
-                return False
-        return True
+        # Compare the scalar coordinates in one go; the blocks are only looked at (and parsed) if those match
+        return ((self.chrom, self.strand, self.start, self.end,
+                 self.thick_start, self.thick_end, self.block_count) ==
+                (other.chrom, other.strand, other.start, other.end,
+                 other.thick_start, other.thick_end, other.block_count) and
+                self.block_sizes == other.block_sizes and
+                self.block_starts == other.block_starts)
 
     def __hash__(self):
         return super().__hash__()
@@ -608,6 +712,36 @@ class BED12:
         else:
             raise ValueError("Erroneous strand provided: {0}".format(self.strand))
 
+    @property
+    def block_sizes(self):
+        """
+        Sizes of the blocks (e.g. exons).
+        :rtype list[int]
+        """
+        if self.__block_sizes is None:
+            self.__block_sizes = [int(x) for x in self.__raw_block_sizes.split(",") if x]
+            self.__raw_block_sizes = None
+        return self.__block_sizes
+
+    @block_sizes.setter
+    def block_sizes(self, block_sizes):
+        self.__block_sizes, self.__raw_block_sizes = block_sizes, None
+
+    @property
+    def block_starts(self):
+        """
+        Start positions of the blocks, relative to the start of the feature.
+        :rtype list[int]
+        """
+        if self.__block_starts is None:
+            self.__block_starts = [int(x) for x in self.__raw_block_starts.split(",") if x]
+            self.__raw_block_starts = None
+        return self.__block_starts
+
+    @block_starts.setter
+    def block_starts(self, block_starts):
+        self.__block_starts, self.__raw_block_starts = block_starts, None
+
     @property
     def cds_len(self):
         """
@@ -836,10 +970,10 @@ class BED12:
                      old_orf[:10], old_orf[-10:])
         assert len(old_orf) > 0, (old_start_pos, old_end_pos)
         assert len(old_orf) % 3 == 0, (old_start_pos, old_end_pos)
-        old_pep = Seq.Seq(old_orf).translate(self.table, gap="N")
-        if "*" in old_pep and old_pep.find("*") < len(old_pep) - 1:
+        old_stop_pos = _find_stop_codon(old_orf, self.table)
+        if old_stop_pos is not None and old_stop_pos < len(old_orf) - 3:
             logger.error("Stop codon found within the ORF of %s (pos %s of %s; phase %s). This is invalid!",
-                         self.id, old_pep.find("*"), len(old_pep), self.phase)
+                         self.id, old_stop_pos // 3, len(old_orf) // 3, self.phase)
 
         self.start_codon = old_orf[:3]
         self.stop_codon = old_orf[-3:]
@@ -851,23 +985,30 @@ class BED12:
         self.end = len(sequence)
         self.thick_start += upstream
         self.thick_end += upstream
-        self.has_start_codon = (str(self.start_codon).upper() in self.table.start_codons)
-        self.has_stop_codon = (str(self.stop_codon).upper() in self.table.stop_codons)
+        start_codons, stop_codons = _codon_sets(self.table)[:2]
+        # The codons come from old_orf, which is already an upper-case str
+        self.has_start_codon = (self.start_codon in start_codons)
+        self.has_stop_codon = (self.stop_codon in stop_codons)
         if expand_orf is True and not (self.has_start_codon and self.has_stop_codon):
             if not self.has_start_codon:
-                for pos in range(old_start_pos + upstream,
-                                 0,
-                                 -3):
-                    codon = sequence[pos:pos + 3].upper()
-
-                    self.thick_start = pos + 1
-                    if codon in self.table.start_codons:
-                        # self.thick_start = pos
-                        self.start_codon = codon
-                        self.__has_start = True
-                        logger.debug("Position %d, codon %s. Start codon found.", pos, codon)
-                        break
-                if self.start_codon not in self.table.start_codons:
+                # Walk upstream from the old start, in frame, looking for a start codon (position 0 excluded).
+                # The region is reversed once, so that the regex engine does the walk.
+                old_start = old_start_pos + upstream
+                if old_start > 0:
+                    reversed_sequence = sequence[old_start + 2::-1]
+                    for match in _reversed_start_codon_pattern(self.table).finditer(reversed_sequence,
+                                                                                    0, old_start + 2):
+                        if match.start() % 3 == 0:
+                            pos = old_start - match.start()
+                            self.thick_start = pos + 1
+                            self.start_codon = match.group(1)[::-1].upper()
+                            self.__has_start = True
+                            logger.debug("Position %d, codon %s. Start codon found.", pos, self.start_codon)
+                            break
+                    else:
+                        # No start codon: the walk ended on the first in-frame position
+                        self.thick_start = (old_start % 3 or 3) + 1
+                if self.start_codon not in start_codons:
                     self.phase = (self.thick_start - 1) % 3
                     logger.debug("No start codon found for %s. Thick start %s, new phase: %s",
                                  self.id, self.thick_start, self.phase)
@@ -876,18 +1017,15 @@ class BED12:
                     self.phase = 0
                     self.__has_start = True
 
-            coding_seq = Seq.Seq(sequence[self.thick_start + self.phase - 1:self.end])
-            if len(coding_seq) % 3 != 0:
-                # Only get a multiple of three
-                coding_seq = coding_seq[:-((len(coding_seq)) % 3)]
-            prot_seq = Seq.translate(coding_seq, table=self.table, gap="N")
-            if "*" in prot_seq:
-                self.thick_end = self.thick_start + self.phase - 1 + (1 + prot_seq.find("*")) * 3
-                self.stop_codon = coding_seq[prot_seq.find("*") * 3:(1 + prot_seq.find("*")) * 3].upper()
+            # Only the first in-frame stop matters, so there is no need to translate the whole sequence
+            stop_pos = _find_stop_codon(sequence, self.table, self.thick_start + self.phase - 1)
+            if stop_pos is not None:
+                self.thick_end = stop_pos + 3
+                self.stop_codon = sequence[stop_pos:stop_pos + 3].upper()
                 self.__has_stop = True
                 logger.debug("New stop codon for %s: %s", self.name, self.thick_end)
 
-            if self.stop_codon not in self.table.stop_codons:
+            if self.stop_codon not in stop_codons:
                 logger.debug("No valid stop codon found for %s", self.name)
                 self.thick_end = self.end
 
@@ -901,13 +1039,9 @@ class BED12:
 
         """This will return the coordinates of the blocks, with a 1-offset (as in GFF3)"""
 
-        # First thing: calculate where each start point will be
-        _blocks = []
-        starts = [_ + self.start - 1 for _ in self.block_starts]
-        for pos in range(self.block_count):
-            _blocks.append((starts[pos] + 1, starts[pos] + self.block_sizes[pos]))
-
-        return _blocks
+        start, block_starts, block_sizes = self.start, self.block_starts, self.block_sizes
+        return [(start + block_starts[pos], start + block_starts[pos] + block_sizes[pos] - 1)
+                for pos in range(self.block_count)]
 
     def to_transcriptomic(self, sequence=None, fasta_index=None, start_adjustment=False,
                           lenient=False, alias=None, coding=True):
@@ -955,31 +1089,29 @@ class BED12:
             bstarts.append(bs + bstarts[-1])
         assert len(bstarts) == len(bsizes) == self.block_count, (bstarts, bsizes, self.block_count)
 
+        name = self.name.split(";", 1)[0]
         if self.coding:
-            new_name = "ID={};coding={};phase={}".format(self.name.split(";")[0],
+            new_name = "ID={};coding={};phase={}".format(name,
                                                          self.coding,
                                                          self.phase if self.phase is not None else 0)
         else:
-            new_name = "ID={};coding={}".format(self.name.split(";")[0], self.coding)
+            new_name = "ID={};coding={}".format(name, self.coding)
 
         if alias is not None:
             new_name += ";alias={}".format(alias)
 
-        new = list((self.name.split(";")[0],
-                    0,
-                    sum(self.block_sizes),
-                    new_name,
-                    self.score,
-                    "+"))
-
-        new.extend(list((
-            tStart,
-            tEnd,
-            self.rgb,
-            self.block_count,
-            bsizes,
-            bstarts
-        )))
+        new = [name,
+               0,
+               sum(self.block_sizes),
+               new_name,
+               self.score,
+               "+",
+               tStart,
+               tEnd,
+               self.rgb,
+               self.block_count,
+               bsizes,
+               bstarts]
 
         new = BED12(new,
                     phase=self.phase,
@@ -994,6 +1126,23 @@ class BED12:
         return new
 
 
+class _LastSequenceIndex:
+    """Wrapper around a FASTA index which keeps the last sequence retrieved from it. ORF files list all the ORFs
+    of a transcript one after the other, so consecutive lookups are nearly always for the same sequence."""
+
+    def __init__(self, index):
+        self.index = index
+        self.__last = (None, None)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __getitem__(self, key):
+        if self.__last[0] != key:
+            self.__last = (key, self.index[key])
+        return self.__last[1]
+
+
 class Bed12Parser(Parser):
     """Parser class for a Bed12Parser file.
     It accepts optionally a fasta index which is used to
@@ -1031,9 +1180,8 @@ class Bed12Parser(Parser):
 
         if isinstance(fasta_index, dict):
             # check that this is a bona fide dictionary ...
-            assert isinstance(
-                fasta_index[random.sample(fasta_index.keys(), 1)],
-                Bio.SeqRecord.SeqRecord)
+            if fasta_index:
+                assert isinstance(next(iter(fasta_index.values())), Bio.SeqRecord.SeqRecord)
         elif fasta_index is not None:
             if isinstance(fasta_index, str):
                 assert os.path.exists(fasta_index)
@@ -1042,6 +1190,7 @@ class Bed12Parser(Parser):
                 assert isinstance(fasta_index, pysam.FastaFile)
 
         self.fasta_index = fasta_index
+        self.__sequences = None if fasta_index is None else _LastSequenceIndex(fasta_index)
         self.__closed = False
         self.header = False
         self.__table = table
@@ -1069,7 +1218,7 @@ class Bed12Parser(Parser):
             if line == '':
                 raise StopIteration
             bed12 = BED12(line,
-                          fasta_index=self.fasta_index,
+                          fasta_index=self.__sequences,
                           transcriptomic=self.transcriptomic,
                           max_regression=self._max_regression,
                           coding=self.coding,
@@ -1087,13 +1236,17 @@ class Bed12Parser(Parser):
             line = self._handle.readline()
             if line == "":
                 raise StopIteration
+            # Only CDS lines are of interest: check the feature before paying for a full GffLine
+            fields = line.split("\t", 3)
+            if len(fields) < 4 or fields[2] != "CDS":
+                continue
             line = GffLine(line)
 
             if line.feature != "CDS":
                 continue
             # Compatibility with BED12
             bed12 = BED12(line,
-                          fasta_index=self.fasta_index,
+                          fasta_index=self.__sequences,
                           transcriptomic=self.transcriptomic,
                           max_regression=self._max_regression,
                           table=self.__table)
@@ -1126,8 +1279,6 @@ class Bed12Parser(Parser):
 
     @property
     def coding(self):
-        if not hasattr(self, "__coding"):
-            self.__coding = False
         return self.__coding
 
     @coding.setter
@@ -290,12 +290,12 @@ class OrfSerializer:
         Generate objects to serialize in parallel
         """
         if row.header is True:
-            continue
+            return None
         if row.invalid is True:
             self.logger.warn("Invalid entry, reason: %s\n%s",
                              row.invalid_reason,
                              row)
-            continue
+            return None
         if row.id in self.cache:
             current_query = self.cache[row.id]
         else:
@@ -23,6 +23,7 @@ import pickle
 import inspect
 from ..parsers.bed12 import BED12
 import pysam
+import networkx as nx
 from pytest import mark
 from itertools import combinations_with_replacement
 logging.getLogger("matplotlib").setLevel(logging.WARNING)
@@ -1462,6 +1463,41 @@ class TestLocus(unittest.TestCase):
                 self.assertEqual(len(superlocus.loci[locus_one_id].transcripts), 1,
                                  (cm.output, superlocus.loci[locus_one_id].transcripts.keys()))
 
+    def test_as_requirements_short_circuit(self):
+
+        t1, t1_1 = Transcript(), Transcript()
+        t1.chrom = t1_1.chrom = "1"
+        t1.id, t1_1.id = "t1", "t1_1"
+        t1.strand = t1_1.strand = "+"
+        t1.add_exons([(101, 500), (801, 1000)])
+        t1.add_exons([(101, 500), (801, 1000)], features="CDS")
+        t1_1.add_exons([(101, 500), (903, 1100), (1301, 1550)])
+        t1_1.add_exons([(101, 500), (903, 1100), (1301, 1550)], features="CDS")
+        t1.finalize()
+        t1_1.finalize()
+
+        conf = configurator.to_json(None)
+        conf["pick"]["alternative_splicing"]["valid_ccodes"] = ["j", "J", "g", "G"]
+        conf["pick"]["alternative_splicing"]["only_confirmed_introns"] = False
+        conf["pick"]["alternative_splicing"]["pad"] = False
+        # The second parameter points to a non-existent metric: it must never be evaluated,
+        # as the first one is already sufficient to determine the result of the expression.
+        conf["as_requirements"] = {"_expression": "cdna_length or invalid",
+                                   "expression": "evaluated['cdna_length'] or evaluated['invalid']",
+                                   "parameters": {
+                                       "cdna_length": {"operator": "gt", "value": 0, "name": "cdna_length"},
+                                       "invalid": {"operator": "gt", "value": 0, "name": "not_a_metric"}
+                                   }}
+
+        locus = Locus(t1, json_conf=conf)
+        locus.add_transcript_to_locus(t1_1)
+        self.assertIn(t1_1.id, locus.transcripts)
+
+        conf["as_requirements"]["expression"] = "evaluated['invalid'] or evaluated['cdna_length']"
+        locus = Locus(t1, json_conf=conf)
+        with self.assertRaises(AttributeError):
+            locus.add_transcript_to_locus(t1_1)
+
 
 class EmptySuperlocus(unittest.TestCase):
 
@@ -2790,6 +2826,30 @@ class PaddingTester(unittest.TestCase):
                     self.assertEqual(expanded_one.end, transcript.end)
                     self.assertNotIn((4001, 5000), expanded_one.exons)
 
+    def test_find_best_sinks(self):
+
+        transcripts = []
+        for num, score in enumerate([5, 10, 3, 8, 1], 1):
+            transcript = Transcript()
+            transcript.chrom, transcript.strand, transcript.id = "Chr5", "+", "t{}".format(num)
+            transcript.add_exons([(1000 + num * 10, 2000)])
+            transcript.finalize()
+            transcript.score = score
+            transcripts.append(transcript)
+
+        logger = create_null_logger("test_find_best_sinks")
+        locus = Locus(transcripts[0], logger=logger)
+        for transcript in transcripts[1:]:
+            locus.add_transcript_to_locus(transcript, check_in_locus=False)
+        for transcript in transcripts:
+            locus.transcripts[transcript.id].score = transcript.score
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(locus.transcripts.keys())
+        graph.add_edges_from([("t1", "t2"), ("t2", "t3"), ("t1", "t4"), ("t5", "t1")])
+        best = locus._find_best_sinks(graph)
+        self.assertEqual(best, {"t1": "t4", "t2": "t3", "t5": "t4"})
+
     def test_pad_multiexonic(self):
 
         transcript = Transcript()
@@ -1,5 +1,10 @@
-from ..parsers.bed12 import BED12
+from ..parsers.bed12 import BED12, Bed12Parser
 from ..transcripts import Transcript
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+import copy
+import io
+import pickle
 import unittest
 # from Bio.Seq import Seq
 
@@ -337,6 +342,65 @@ CTCGGCAGATAG"""
         self.assertEqual(t.exon_num, 2)  # The touching exons should have been merged
         self.assertEqual(t.exons, [(172602, 174081), (174766, 175626)], t.exons)
 
+    def test_internal_stop_codons(self):
+
+        for seq, stops in [("ATG" + "GCA" * 10 + "TAA", 0),
+                           ("ATG" + "GCA" * 4 + "TGA" + "GCA" * 5 + "TAA", 1),
+                           ("atg" + "gca" * 4 + "tag" + "GNA" * 2 + "TAG" + "GCA" * 2 + "TAA", 2),
+                           ("ATG" + "GTA" + "AGC" * 8 + "TAA", 0)]:
+            with self.subTest(seq=seq):
+                line = "\t".join(["t1", "0", str(len(seq)), "ID=t1.p1;coding=True;phase=0", "0", "+",
+                                  "0", str(len(seq)), "0", "1", str(len(seq)), "0"])
+                bed = BED12(line, transcriptomic=True, sequence=seq)
+                self.assertEqual(bed.invalid, stops > 0)
+                if stops:
+                    self.assertEqual(bed.invalid_reason, "{} internal stop codons found".format(stops))
+
+    def test_expand_to_stop_codon(self):
+
+        seq = "ATG" + "GCA" * 4
+        line = "\t".join(["t1", "0", str(len(seq)), "ID=t1.p1;coding=True;phase=0", "0", "+",
+                          "0", str(len(seq)), "0", "1", str(len(seq)), "0"])
+        # In table 31, TAA codes for glutamate unless it is at the end of the ORF, so it must not be taken as a stop
+        for table, thick_end, has_stop in [(1, 23, True), (31, 25, False)]:
+            with self.subTest(table=table):
+                bed = BED12(line, transcriptomic=True, sequence=seq, table=table)
+                bed.expand("cc" + seq + "GCAtaaGC", 2, 8, expand_orf=True)
+                self.assertEqual(bed.thick_start, 3)
+                self.assertEqual(bed.thick_end, thick_end)
+                self.assertEqual(bed.has_stop_codon, has_stop)
+
+    def test_parser_with_dict_index(self):
+
+        seq = "ATG" + "GCA" * 10 + "TAA"
+        line = "\t".join(["t1", "0", str(len(seq)), "ID=t1.p1;coding=True;phase=0", "0", "+",
+                          "0", str(len(seq)), "0", "1", str(len(seq)), "0"])
+        parser = Bed12Parser(io.StringIO(line + "\n"), fasta_index={"t1": SeqRecord(Seq(seq), id="t1")},
+                             transcriptomic=True)
+        bed = next(parser)
+        self.assertFalse(bed.invalid, bed.invalid_reason)
+        self.assertTrue(bed.has_start_codon)
+        self.assertTrue(bed.has_stop_codon)
+
+    def test_parser_coding(self):
+
+        self.assertFalse(Bed12Parser(io.StringIO("")).coding)
+        self.assertTrue(Bed12Parser(io.StringIO(""), coding=True).coding)
+
+    def test_copy(self):
+
+        bed12line = ["chr1", 172601, 175626, "ID=foo.1;coding=True;phase=0", 100, "-", 172601, 175626, "0,0,0",
+                     3, "199,1281,861,", "0,199,2164"]
+        bed = BED12(bed12line, transcriptomic=False, table="Standard")
+        for copied in (bed.copy(), copy.deepcopy(bed), pickle.loads(pickle.dumps(bed))):
+            with self.subTest(copied=copied):
+                self.assertEqual(copied, bed)
+                self.assertEqual(str(copied), str(bed))
+                self.assertIs(copied.table, bed.table)
+                self.assertIsNot(copied.block_sizes, bed.block_sizes)
+                copied.block_sizes[0] += 1
+                self.assertEqual(bed.block_sizes, [199, 1281, 861])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -686,6 +686,15 @@ class Transcript:
         # Set the logger to NullHandler
         self.logger = None
 
+    def __deepcopy__(self, memodict=None):
+        # __getstate__ already returns a deep copy of the instance dictionary;
+        # restore it directly rather than having copy.deepcopy copy it a second time.
+        new = self.__class__.__new__(self.__class__)
+        if memodict is not None:
+            memodict[id(self)] = new
+        new.__setstate__(self.__getstate__())
+        return new
+
     # ######## Class instance methods ####################
 
     def add_exon(self, gffline, feature=None, phase=None):
@@ -1123,12 +1132,15 @@ class Transcript:
         assert self.combined_utr == self.three_utr == self.five_utr == [], (
             self.combined_utr, self.three_utr, self.five_utr, self.start, self.end)
 
-    def strip_cds(self, strand_specific=True):
+    def strip_cds(self, strand_specific=True, finalize=True):
         """Method to completely remove CDS information from a transcript.
         Necessary for those cases where the input is malformed.
 
         :param strand_specific: boolean flag. If set to False and the transcript is monoexonic,
         the strand will be removed from it.
+
+        :param finalize: boolean flag. If set to False, the transcript will be left unfinalized,
+        e.g. because it is going to be further modified.
         """
 
         self.logger.debug("Stripping CDS from {0}".format(self.id))
@@ -1147,7 +1159,8 @@ class Transcript:
         self.combined_utr = []
         self.segments = []
         self.internal_orfs = []
-        self.finalize()
+        if finalize is True:
+            self.finalize()
 
     def copy(self):
         """
@@ -1157,6 +1170,22 @@ class Transcript:
 
         return copy.copy(self)
 
+    def _shallow_copy(self):
+        """
+        Private method to return a copy of the instance which shares the structure (exons,
+        ORF segments, interval trees) with the original, without going through __getstate__.
+        The containers which are modified in place on the copy (the ORF list, the cache of the
+        ORF transcripts and the attributes) are rebound, so that the original is left untouched.
+        :rtype: Transcript
+        """
+
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.internal_orfs = self.internal_orfs[:]
+        new.__internal_orf_transcripts = []
+        new.attributes = self.attributes.copy()
+        return new
+
     def deepcopy(self):
         """
         Method to return a deep copy of the current instance.
@@ -2395,8 +2424,7 @@ index {3}, internal ORFs: {4}".format(
         if self.__cdna_length is None and self.finalized is True:
             raise AssertionError
         if self.finalized is False or self.__cdna_length is None:
-            ar = np.array(list(zip(*self.exons)))
-            self.__cdna_length = int(np.subtract(ar[1], ar[0] - 1).sum())
+            self.__cdna_length = sum(exon[1] - exon[0] + 1 for exon in self.exons)
         return self.__cdna_length
 
     cdna_length.category = "cDNA"